@@ -1,3 +1,21 @@
 """LocalDuck — Local AI-Powered Code Quality & Security Scanner."""
 
+import logging
+import os
+
+import structlog
+
 __version__ = "0.1.0"
+
+# Filter events at the bound-logger level so dropped debug/info calls cost a
+# single int comparison and never run the processor chain.
+_LOG_LEVEL = getattr(
+    logging,
+    os.environ.get("LOCALDUCK_LOG_LEVEL", "WARNING").upper(),
+    logging.WARNING,
+)
+
+structlog.configure(
+    wrapper_class=structlog.make_filtering_bound_logger(_LOG_LEVEL),
+    cache_logger_on_first_use=True,
+)
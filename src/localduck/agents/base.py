@@ -2,20 +2,41 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import re
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+import ijson
+import orjson
 import structlog
 
+from localduck.scanner.batcher import batch_diffs
 from localduck.types import CheckCategory, FileDiff, Issue, Severity
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from localduck.config import LocalDuckConfig
 
 logger = structlog.get_logger()
 
+# An added/removed line with non-whitespace content. The +++/--- file
+# headers are excluded by the lookaheads; context, header, and hunk-marker
+# lines never start with a lone +/- sigil. A diff with no such line is
+# whitespace-only and carries nothing reviewable.
+_NONTRIVIAL_LINE_RE = re.compile(r"^(?:\+(?!\+\+)|-(?!--)).*\S", re.MULTILINE)
+
+# Markdown fences occasionally wrapped around responses, compiled once
+_FENCE_OPEN_RE = re.compile(r"\A```(?:json)?[ \t]*\n?")
+_FENCE_CLOSE_RE = re.compile(r"\n?[ \t]*```\Z")
+
+# Enum members keyed by value — a dict lookup per item instead of
+# EnumMeta.__call__ in the parse hot path
+_SEVERITY_BY_VALUE: dict[str, Severity] = {s.value: s for s in Severity}
+_CATEGORY_BY_VALUE: dict[str, CheckCategory] = {c.value: c for c in CheckCategory}
+
 # Display names for check categories used in prompts
 _CHECK_LABELS: dict[CheckCategory, str] = {
     CheckCategory.CODE_QUALITY: "Code Quality",
@@ -30,22 +51,27 @@ _CHECK_LABELS: dict[CheckCategory, str] = {
 }
 
 
-def build_system_prompt(categories: list[CheckCategory]) -> str:
-    """Build the system prompt describing the reviewer's role."""
+@lru_cache(maxsize=8)
+def build_system_prompt(categories: tuple[CheckCategory, ...]) -> str:
+    """Build the system prompt describing the reviewer's role.
+
+    Cached for the process lifetime; the same categories tuple is reused by
+    every adapter built from the same config.
+    """
     check_list = "\n".join(f"- {_CHECK_LABELS[c]}" for c in categories)
     return (
         "You are a senior code reviewer performing an automated pre-commit review.\n"
         "Analyze the provided git diff and find issues in these categories:\n"
         f"{check_list}\n\n"
-        "For each issue found, respond with a JSON array of objects. Each object must have:\n"
+        'Respond with a JSON object of the form {"issues": [...]} where each entry has:\n'
         '  "file": string (file path),\n'
         '  "line": number or null (line number if identifiable),\n'
         '  "severity": "critical" | "warning" | "info",\n'
         '  "category": one of the check category identifiers,\n'
         '  "message": string (concise description of the issue),\n'
         '  "suggestion": string (how to fix it, or empty string)\n\n'
-        "If no issues are found, respond with an empty JSON array: []\n"
-        "Respond ONLY with the JSON array — no markdown fences, no explanation."
+        'If no issues are found, respond with {"issues": []}\n'
+        "Respond ONLY with the JSON object — no markdown fences, no explanation."
     )
 
 
@@ -57,46 +83,55 @@ def build_review_prompt(diffs: list[FileDiff]) -> str:
     return "\n\n".join(parts)
 
 
+def _issue_from_item(item: object) -> Issue | None:
+    """Build an Issue from one parsed response object, or None if malformed."""
+    if not isinstance(item, dict):
+        return None
+    try:
+        severity = _SEVERITY_BY_VALUE.get(item.get("severity", "info"))
+        category = _CATEGORY_BY_VALUE.get(item.get("category", "codeQuality"))
+    except TypeError:
+        severity = category = None
+    if severity is None or category is None:
+        logger.warning("skipping_malformed_issue", item=item)
+        return None
+    return Issue(
+        file=str(item.get("file", "unknown")),
+        line=item.get("line"),
+        severity=severity,
+        category=category,
+        message=str(item.get("message", "")),
+        suggestion=str(item.get("suggestion", "")),
+    )
+
+
 def parse_review_response(raw: str) -> list[Issue]:
     """Parse the LLM response into a list of Issue objects."""
-    # Strip markdown fences if present
+    # Strip markdown fences if present; JSON-mode responses skip the regexes
     cleaned = raw.strip()
-    cleaned = re.sub(r"^```(?:json)?\s*", "", cleaned)
-    cleaned = re.sub(r"\s*```$", "", cleaned)
-    cleaned = cleaned.strip()
+    if cleaned.startswith("```"):
+        cleaned = _FENCE_OPEN_RE.sub("", cleaned)
+        cleaned = _FENCE_CLOSE_RE.sub("", cleaned)
+        cleaned = cleaned.strip()
 
     if not cleaned or cleaned == "[]":
         return []
 
     try:
-        data = json.loads(cleaned)
-    except json.JSONDecodeError:
+        data = orjson.loads(cleaned)
+    except orjson.JSONDecodeError:
         logger.warning("failed_to_parse_llm_response", raw=raw[:200])
         return []
 
+    # JSON-mode providers return {"issues": [...]}; older prompts returned a bare array
+    if isinstance(data, dict):
+        data = data.get("issues", [])
+
     if not isinstance(data, list):
         logger.warning("llm_response_not_array", raw=raw[:200])
         return []
 
-    issues: list[Issue] = []
-    for item in data:
-        if not isinstance(item, dict):
-            continue
-        try:
-            issues.append(
-                Issue(
-                    file=str(item.get("file", "unknown")),
-                    line=item.get("line"),
-                    severity=Severity(item.get("severity", "info")),
-                    category=CheckCategory(item.get("category", "codeQuality")),
-                    message=str(item.get("message", "")),
-                    suggestion=str(item.get("suggestion", "")),
-                )
-            )
-        except (ValueError, KeyError):
-            logger.warning("skipping_malformed_issue", item=item)
-
-    return issues
+    return [issue for item in data if (issue := _issue_from_item(item)) is not None]
 
 
 class BaseAdapter(ABC):
@@ -105,6 +140,9 @@ class BaseAdapter(ABC):
     def __init__(self, config: LocalDuckConfig) -> None:
         self.config = config
         self._categories = config.checks.enabled_categories()
+        # Built once per adapter — keeping the prefix byte-identical across
+        # batches also lets provider-side prompt caching hit
+        self._system_prompt = build_system_prompt(self._categories)
 
     @property
     def label(self) -> str:
@@ -112,19 +150,134 @@ class BaseAdapter(ABC):
         return "base"
 
     @abstractmethod
-    async def _call_llm(self, system_prompt: str, user_prompt: str) -> str:
-        """Send a prompt to the LLM and return the raw response text."""
+    def _stream_llm(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        """Stream raw response text deltas from the LLM."""
         ...
 
-    async def review(self, diffs: list[FileDiff]) -> list[Issue]:
-        """Review a batch of file diffs and return found issues."""
-        if not diffs:
-            return []
+    async def aclose(self) -> None:  # noqa: B027
+        """Release adapter-held resources (HTTP connections etc.).
+
+        Deliberately a no-op rather than abstract: most adapters hold
+        nothing and shouldn't be forced to override it.
+        """
+
+    def _should_review(self, diffs: list[FileDiff]) -> bool:
+        """Cheap pre-filter — skip the LLM round trip for no-op batches."""
+        total = sum(len(fd.diff) for fd in diffs)
+        if total < self.config.skip_threshold_bytes:
+            logger.debug("skipping_tiny_batch", total_bytes=total)
+            return False
+        combined = "\n".join(fd.diff for fd in diffs)
+        if _NONTRIVIAL_LINE_RE.search(combined) is None:
+            logger.debug("skipping_trivial_batch", files=len(diffs))
+            return False
+        return True
+
+    async def review(self, diffs: list[FileDiff]) -> AsyncIterator[Issue]:
+        """Review a batch of file diffs, yielding issues as they are parsed.
+
+        Response deltas are fed into an incremental JSON parser so each issue
+        is emitted as soon as its closing brace arrives, instead of waiting
+        for the full completion. Issues parsed before a stream error are
+        still emitted; if nothing could be parsed incrementally the full
+        response text is parsed once as a fallback.
+        """
+        if not diffs or not self._should_review(diffs):
+            return
 
-        system = build_system_prompt(self._categories)
         user = build_review_prompt(diffs)
 
         logger.debug("calling_llm", adapter=self.label, num_diffs=len(diffs))
-        raw_response = await self._call_llm(system, user)
 
-        return parse_review_response(raw_response)
+        system = self._system_prompt
+        items = ijson.sendable_list()
+        coro = ijson.items_coro(items, "item")
+        chunks: list[str] = []
+        started = False
+        failed = False
+        yielded = 0
+
+        async for delta in self._stream_llm(system, user):
+            chunks.append(delta)
+            if not started:
+                # Skip any prose/fence prefix until the issues array opens
+                head = "".join(chunks)
+                bracket = head.find("[")
+                if bracket < 0:
+                    continue
+                delta = head[bracket:]
+                started = True
+            try:
+                coro.send(delta.encode("utf-8"))
+            except ijson.JSONError:
+                failed = True
+                break
+            while items:
+                issue = _issue_from_item(items.pop(0))
+                if issue is not None:
+                    yielded += 1
+                    yield issue
+
+        if started and not failed:
+            try:
+                coro.close()
+            except ijson.JSONError:
+                failed = True
+
+        # Drain unconditionally: object-mode responses end with a "}" after
+        # the issues array, which the array-level parser rejects as trailing
+        # garbage — after items completed in the same delta were appended
+        while items:
+            issue = _issue_from_item(items.pop(0))
+            if issue is not None:
+                yielded += 1
+                yield issue
+
+        # Fall back to one-shot parsing if incremental parsing got nowhere
+        if yielded == 0 and (failed or not started):
+            for issue in parse_review_response("".join(chunks)):
+                yield issue
+
+    async def review_many(
+        self,
+        diffs: list[FileDiff],
+        max_tokens_per_batch: int = 12_000,
+        token_budget: int | None = None,
+    ) -> tuple[list[Issue], list[str]]:
+        """Review diffs packed into as few LLM calls as possible.
+
+        Diffs are greedily batched within context-window limits so the fixed
+        system-prompt tokens and per-request latency are amortized across
+        files. Batches are reviewed concurrently up to config.max_concurrent.
+
+        Returns:
+            (issues, skipped_paths) — paths dropped by the token budget.
+        """
+        batches, skipped = batch_diffs(
+            diffs,
+            max_tokens_per_batch=max_tokens_per_batch,
+            token_budget=token_budget,
+        )
+        if not batches:
+            return [], skipped
+
+        semaphore = asyncio.Semaphore(self.config.max_concurrent)
+
+        async def _review_batch(batch: list[FileDiff], batch_idx: int) -> list[Issue]:
+            async with semaphore:
+                logger.debug("reviewing_batch", batch=batch_idx, files=len(batch))
+                return [issue async for issue in self.review(batch)]
+
+        batch_results = await asyncio.gather(
+            *(_review_batch(batch, i) for i, batch in enumerate(batches)),
+            return_exceptions=True,
+        )
+
+        issues: list[Issue] = []
+        for i, batch_result in enumerate(batch_results):
+            if isinstance(batch_result, Exception):
+                logger.error("batch_review_failed", batch=i, error=str(batch_result))
+                continue
+            issues.extend(batch_result)
+
+        return issues, skipped
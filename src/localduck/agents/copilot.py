@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import json
 from typing import TYPE_CHECKING
 
-import httpx
 import structlog
 
 from localduck.agents.base import BaseAdapter
 from localduck.agents.detect import detect_copilot
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from localduck.config import LocalDuckConfig
 
 logger = structlog.get_logger()
@@ -24,6 +26,9 @@ class CopilotAdapter(BaseAdapter):
 
     def __init__(self, config: LocalDuckConfig) -> None:
         super().__init__(config)
+        # Deferred so importing the agents package stays cheap
+        import httpx
+
         status = detect_copilot()
         if not status.available or not status.token:
             raise RuntimeError(
@@ -32,12 +37,26 @@ class CopilotAdapter(BaseAdapter):
             )
         self._token = status.token
         self._model = config.model or DEFAULT_MODEL
+        # One pooled client for the adapter's lifetime — keep-alive + HTTP/2
+        # multiplexing avoid a TCP/TLS handshake per reviewed batch
+        self._client = httpx.AsyncClient(
+            timeout=120.0,
+            http2=True,
+            headers={
+                "Authorization": f"Bearer {self._token}",
+                "Content-Type": "application/json",
+            },
+            limits=httpx.Limits(max_keepalive_connections=8),
+        )
 
     @property
     def label(self) -> str:
         return f"Copilot ({self._model})"
 
-    async def _call_llm(self, system_prompt: str, user_prompt: str) -> str:
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def _stream_llm(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
         payload = {
             "model": self._model,
             "messages": [
@@ -45,19 +64,26 @@ class CopilotAdapter(BaseAdapter):
                 {"role": "user", "content": user_prompt},
             ],
             "temperature": 0.1,
-        }
-        headers = {
-            "Authorization": f"Bearer {self._token}",
-            "Content-Type": "application/json",
+            "response_format": {"type": "json_object"},
+            "stream": True,
         }
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                GITHUB_MODELS_URL,
-                json=payload,
-                headers=headers,
-            )
+        async with self._client.stream(
+            "POST",
+            GITHUB_MODELS_URL,
+            json=payload,
+        ) as response:
             response.raise_for_status()
-
-        data = response.json()
-        return data["choices"][0]["message"]["content"]
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:]
+                if data == "[DONE]":
+                    break
+                chunk = json.loads(data)
+                choices = chunk.get("choices") or []
+                if not choices:
+                    continue
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    yield delta
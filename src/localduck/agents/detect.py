@@ -5,6 +5,8 @@ from __future__ import annotations
 import os
 import subprocess
 from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 
 import structlog
 
@@ -20,15 +22,57 @@ class CopilotStatus:
     reason: str = ""
 
 
+def _gh_hosts_token() -> str | None:
+    """Read the oauth token straight from gh's hosts.yml, if possible.
+
+    Avoids spawning a `gh` subprocess on every startup; returns None when the
+    file is missing or unreadable (e.g. token stored in the system keyring).
+    """
+    try:
+        import yaml
+    except ImportError:
+        return None
+
+    config_dir = os.environ.get("GH_CONFIG_DIR")
+    candidates = [
+        (Path(config_dir) if config_dir else Path.home() / ".config" / "gh") / "hosts.yml",
+    ]
+    if os.name == "nt" and (appdata := os.environ.get("APPDATA")):
+        candidates.append(Path(appdata) / "GitHub CLI" / "hosts.yml")
+
+    for path in candidates:
+        try:
+            raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        except (OSError, yaml.YAMLError):
+            continue
+        if isinstance(raw, dict):
+            token = (raw.get("github.com") or {}).get("oauth_token")
+            if token:
+                return str(token)
+    return None
+
+
+@lru_cache(maxsize=1)
 def detect_copilot() -> CopilotStatus:
-    """Check if GitHub Copilot is usable via `gh` CLI or GITHUB_TOKEN."""
+    """Check if GitHub Copilot is usable via `gh` CLI or GITHUB_TOKEN.
+
+    The result is cached for the lifetime of the process — auth state does
+    not change mid-run, and this is called from both the adapter constructor
+    and the setup wizard.
+    """
     # 1. Check environment variable
     env_token = os.environ.get("GITHUB_TOKEN")
     if env_token:
         logger.debug("copilot_detected_via_env")
         return CopilotStatus(available=True, token=env_token, reason="GITHUB_TOKEN env")
 
-    # 2. Try gh auth token
+    # 2. Read gh's hosts.yml directly — no fork/exec needed
+    file_token = _gh_hosts_token()
+    if file_token:
+        logger.debug("copilot_detected_via_hosts_yml")
+        return CopilotStatus(available=True, token=file_token, reason="gh hosts.yml")
+
+    # 3. Fall back to gh auth token
     try:
         result = subprocess.run(
             ["gh", "auth", "token"],
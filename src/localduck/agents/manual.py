@@ -2,67 +2,122 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 import structlog
-from litellm import acompletion
 
 from localduck.agents.base import BaseAdapter
 from localduck.types import ProviderId
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
     from localduck.config import LocalDuckConfig
 
 logger = structlog.get_logger()
 
-# Provider → default model mapping
-PROVIDER_DEFAULTS: dict[ProviderId, str] = {
-    "openai": "gpt-4o",
-    "anthropic": "claude-sonnet-4-20250514",
-    "xai": "grok-3",
-    "gemini": "gemini/gemini-2.0-flash",
-    "deepseek": "deepseek/deepseek-chat",
-    "mistral": "mistral/mistral-large-latest",
+@dataclass(frozen=True, slots=True)
+class ProviderSpec:
+    """Static metadata for one supported provider."""
+
+    name: str
+    default_model: str
+    models: tuple[str, ...]
+    api_key_env: str
+    # Whether LiteLLM expects "<provider>/<model>" identifiers
+    prefixed: bool
+
+
+# All provider metadata in one place — one lookup instead of four
+PROVIDERS: dict[ProviderId, ProviderSpec] = {
+    "openai": ProviderSpec(
+        name="OpenAI",
+        default_model="gpt-4o",
+        models=("gpt-4o", "gpt-4o-mini", "o1", "o3-mini"),
+        api_key_env="OPENAI_API_KEY",
+        prefixed=False,
+    ),
+    "anthropic": ProviderSpec(
+        name="Anthropic",
+        default_model="claude-sonnet-4-20250514",
+        models=(
+            "claude-sonnet-4-20250514",
+            "claude-opus-4-20250514",
+            "claude-3-5-haiku-20241022",
+        ),
+        api_key_env="ANTHROPIC_API_KEY",
+        prefixed=False,
+    ),
+    "xai": ProviderSpec(
+        name="xAI",
+        default_model="grok-3",
+        models=("grok-3", "grok-3-mini"),
+        api_key_env="XAI_API_KEY",
+        prefixed=False,
+    ),
+    "gemini": ProviderSpec(
+        name="Google Gemini",
+        default_model="gemini/gemini-2.0-flash",
+        models=("gemini/gemini-2.0-flash", "gemini/gemini-2.0-pro", "gemini/gemini-1.5-pro"),
+        api_key_env="GEMINI_API_KEY",
+        prefixed=True,
+    ),
+    "deepseek": ProviderSpec(
+        name="DeepSeek",
+        default_model="deepseek/deepseek-chat",
+        models=("deepseek/deepseek-chat", "deepseek/deepseek-reasoner"),
+        api_key_env="DEEPSEEK_API_KEY",
+        prefixed=True,
+    ),
+    "mistral": ProviderSpec(
+        name="Mistral",
+        default_model="mistral/mistral-large-latest",
+        models=("mistral/mistral-large-latest", "mistral/codestral-latest"),
+        api_key_env="MISTRAL_API_KEY",
+        prefixed=True,
+    ),
 }
 
-# Provider → display name
-PROVIDER_NAMES: dict[ProviderId, str] = {
-    "openai": "OpenAI",
-    "anthropic": "Anthropic",
-    "xai": "xAI",
-    "gemini": "Google Gemini",
-    "deepseek": "DeepSeek",
-    "mistral": "Mistral",
-}
 
-# Provider → list of available models for setup wizard
-PROVIDER_MODELS: dict[ProviderId, list[str]] = {
-    "openai": ["gpt-4o", "gpt-4o-mini", "o1", "o3-mini"],
-    "anthropic": ["claude-sonnet-4-20250514", "claude-opus-4-20250514", "claude-3-5-haiku-20241022"],
-    "xai": ["grok-3", "grok-3-mini"],
-    "gemini": ["gemini/gemini-2.0-flash", "gemini/gemini-2.0-pro", "gemini/gemini-1.5-pro"],
-    "deepseek": ["deepseek/deepseek-chat", "deepseek/deepseek-reasoner"],
-    "mistral": ["mistral/mistral-large-latest", "mistral/codestral-latest"],
-}
-
-# Map provider → LiteLLM env variable name for the API key
-_API_KEY_ENV_MAP: dict[ProviderId, str] = {
-    "openai": "OPENAI_API_KEY",
-    "anthropic": "ANTHROPIC_API_KEY",
-    "xai": "XAI_API_KEY",
-    "gemini": "GEMINI_API_KEY",
-    "deepseek": "DEEPSEEK_API_KEY",
-    "mistral": "MISTRAL_API_KEY",
+# Tool schema used to force structured output from providers without a JSON mode
+_REPORT_ISSUES_TOOL: dict[str, Any] = {
+    "type": "function",
+    "function": {
+        "name": "report_issues",
+        "description": "Report all issues found in the reviewed diff.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "issues": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "file": {"type": "string"},
+                            "line": {"type": ["integer", "null"]},
+                            "severity": {
+                                "type": "string",
+                                "enum": ["critical", "warning", "info"],
+                            },
+                            "category": {"type": "string"},
+                            "message": {"type": "string"},
+                            "suggestion": {"type": "string"},
+                        },
+                        "required": ["file", "severity", "category", "message"],
+                    },
+                }
+            },
+            "required": ["issues"],
+        },
+    },
 }
 
 
 def _litellm_model_name(provider: ProviderId, model: str) -> str:
     """Return the model identifier LiteLLM expects."""
-    # LiteLLM expects provider-prefixed names for some providers
     # If the model already contains a '/', it's already prefixed
-    if "/" in model:
-        return model
-    if provider in ("openai", "anthropic", "xai"):
+    if "/" in model or not PROVIDERS[provider].prefixed:
         return model
     return f"{provider}/{model}"
 
@@ -75,32 +130,60 @@ class ManualAdapter(BaseAdapter):
         if not config.provider:
             raise RuntimeError("Manual mode requires a provider. Run `localduck setup`.")
         self._provider: ProviderId = config.provider
-        self._model = config.model or PROVIDER_DEFAULTS[self._provider]
+        spec = PROVIDERS[self._provider]
+        self._model = config.model or spec.default_model
         self._api_key = config.api_key
 
-        # Set the API key for LiteLLM
-        if self._api_key:
-            import os
-
-            env_var = _API_KEY_ENV_MAP.get(self._provider)
-            if env_var:
-                os.environ[env_var] = self._api_key
-
     @property
     def label(self) -> str:
-        display = PROVIDER_NAMES.get(self._provider, self._provider)
-        return f"{display} ({self._model})"
+        return f"{PROVIDERS[self._provider].name} ({self._model})"
+
+    async def _stream_llm(self, system_prompt: str, user_prompt: str) -> AsyncIterator[str]:
+        # Deferred — importing litellm costs hundreds of ms and is only
+        # needed once a review actually runs
+        from litellm import acompletion
 
-    async def _call_llm(self, system_prompt: str, user_prompt: str) -> str:
         model_name = _litellm_model_name(self._provider, self._model)
 
+        # Constrain decoding provider-side so responses are valid JSON without
+        # markdown fences. Anthropic has no JSON mode, so force a tool call there.
+        extra: dict[str, Any] = {}
+        system_message: dict[str, Any] = {"role": "system", "content": system_prompt}
+        if self._provider == "anthropic":
+            extra["tools"] = [_REPORT_ISSUES_TOOL]
+            extra["tool_choice"] = {"type": "function", "function": {"name": "report_issues"}}
+            # Mark the static instruction block for Anthropic prompt caching —
+            # subsequent scans in a session pay cached-token prices on it
+            system_message["content"] = [
+                {
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }
+            ]
+        else:
+            # For Gemini, LiteLLM translates this to response_mime_type
+            extra["response_format"] = {"type": "json_object"}
+
         response = await acompletion(
             model=model_name,
             messages=[
-                {"role": "system", "content": system_prompt},
+                system_message,
                 {"role": "user", "content": user_prompt},
             ],
             temperature=0.1,
+            stream=True,
+            # Scoped to the call — avoids mutating os.environ at construction
+            api_key=self._api_key,
+            **extra,
         )
 
-        return response.choices[0].message.content  # type: ignore[union-attr]
+        async for chunk in response:  # type: ignore[union-attr]
+            delta = chunk.choices[0].delta
+            if getattr(delta, "tool_calls", None):
+                # Tool-call argument fragments form the {"issues": [...]} payload
+                fragment = delta.tool_calls[0].function.arguments
+                if fragment:
+                    yield fragment
+            elif delta.content:
+                yield delta.content
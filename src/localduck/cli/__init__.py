@@ -130,18 +130,20 @@ def version() -> None:
 
 def _print_summary(result) -> None:  # type: ignore[no-untyped-def]
     """Print a Rich summary of scan results to the console."""
-    from localduck.types import CheckCategory, Severity
+    from localduck.types import Severity
 
     if not result.issues:
         console.print("  ✅ [green]No issues found[/green]")
         return
 
-    # Group by category
-    from collections import defaultdict
+    # Bucket by category and count severities in one pass
+    from collections import Counter, defaultdict
 
     by_category: dict[str, list] = defaultdict(list)
+    counts: Counter[tuple[str, Severity]] = Counter()
     for issue in result.issues:
         by_category[issue.category.value].append(issue)
+        counts[(issue.category.value, issue.severity)] += 1
 
     category_labels = {
         "codeQuality": "Code Quality",
@@ -160,9 +162,9 @@ def _print_summary(result) -> None:  # type: ignore[no-untyped-def]
         if not issues:
             console.print(f"  ✔ {label:<20} [green]Passed[/green]")
         else:
-            critical = sum(1 for i in issues if i.severity == Severity.CRITICAL)
-            warning = sum(1 for i in issues if i.severity == Severity.WARNING)
-            info_count = sum(1 for i in issues if i.severity == Severity.INFO)
+            critical = counts[(cat_value, Severity.CRITICAL)]
+            warning = counts[(cat_value, Severity.WARNING)]
+            info_count = counts[(cat_value, Severity.INFO)]
 
             parts = []
             if critical:
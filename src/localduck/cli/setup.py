@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
-import questionary
 from rich.console import Console
 
 from localduck.agents.detect import detect_copilot
-from localduck.agents.manual import PROVIDER_MODELS, PROVIDER_NAMES
+from localduck.agents.manual import PROVIDERS
 from localduck.config import ChecksConfig, LocalDuckConfig, save_config
 from localduck.hooks.install import install_hook
 from localduck.types import BlockOn, ProviderId, ReportFormat
@@ -18,6 +18,9 @@ console = Console()
 
 def run_setup() -> None:
     """Run the interactive setup wizard."""
+    # Deferred — only the setup command pays the questionary import
+    import questionary
+
     console.print("\n🦆 [bold]LocalDuck Setup[/bold]\n")
 
     # Step 1: Detect Copilot
@@ -43,8 +46,8 @@ def run_setup() -> None:
 
     if agent == "manual":
         provider_choices = [
-            questionary.Choice(title=name, value=pid)
-            for pid, name in PROVIDER_NAMES.items()
+            questionary.Choice(title=spec.name, value=pid)
+            for pid, spec in PROVIDERS.items()
         ]
         provider = questionary.select(
             "Select AI provider:",
@@ -55,9 +58,10 @@ def run_setup() -> None:
             console.print("[red]Setup cancelled.[/red]")
             return
 
+        spec = PROVIDERS[provider]
+
         # Model selection
-        models = PROVIDER_MODELS[provider]
-        model_choices = [questionary.Choice(title=m, value=m) for m in models]
+        model_choices = [questionary.Choice(title=m, value=m) for m in spec.models]
         model_choices.append(questionary.Choice(title="Enter custom model name", value="__custom__"))
 
         model = questionary.select(
@@ -72,14 +76,19 @@ def run_setup() -> None:
             console.print("[red]Setup cancelled.[/red]")
             return
 
-        # API key
-        api_key = questionary.password(
-            f"Enter {PROVIDER_NAMES[provider]} API key:",
-        ).ask()
-
-        if not api_key:
-            console.print("[red]API key is required for manual mode.[/red]")
-            return
+        # API key — skip the prompt (and keep the key out of the rc file)
+        # when the provider's env var is exported; LiteLLM falls back to it
+        # when the config carries no key
+        if os.environ.get(spec.api_key_env):
+            console.print(f"  ✅ Using {spec.name} API key from ${spec.api_key_env}\n")
+        else:
+            api_key = questionary.password(
+                f"Enter {spec.name} API key (or set {spec.api_key_env}):",
+            ).ask()
+
+            if not api_key:
+                console.print("[red]API key is required for manual mode.[/red]")
+                return
 
     # Step 3: Check selection
     console.print("\n[bold]Select checks to enable:[/bold]\n")
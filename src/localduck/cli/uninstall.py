@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
 from rich.console import Console
 
-from localduck.config import CONFIG_FILENAME
+from localduck.config import find_config_file
 from localduck.git import get_repo_root
 
 console = Console()
@@ -16,29 +14,34 @@ def run_uninstall() -> None:
     """Remove the pre-commit hook and .localduckrc config."""
     removed_anything = False
 
-    # Remove pre-commit hook
+    # Remove pre-commit hook — read directly instead of stat-then-read
     try:
         repo_root = get_repo_root()
         hook_path = repo_root / ".git" / "hooks" / "pre-commit"
-        if hook_path.is_file():
+        try:
             content = hook_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            console.print("  ℹ️  No pre-commit hook found.")
+        else:
             if "localduck" in content.lower():
-                hook_path.unlink()
+                hook_path.unlink(missing_ok=True)
                 console.print(f"  ✅ Removed pre-commit hook: [bold]{hook_path}[/bold]")
                 removed_anything = True
             else:
                 console.print("  ⚠️  Pre-commit hook exists but wasn't installed by LocalDuck — skipped.")
-        else:
-            console.print("  ℹ️  No pre-commit hook found.")
     except RuntimeError:
         console.print("  ⚠️  Not inside a git repository — skipping hook removal.")
 
-    # Remove config
-    config_path = Path.cwd() / CONFIG_FILENAME
-    if config_path.is_file():
-        config_path.unlink()
-        console.print(f"  ✅ Removed config: [bold]{config_path}[/bold]")
-        removed_anything = True
+    # Remove config — same walk-up lookup load_config uses, not just cwd
+    config_path = find_config_file()
+    if config_path is not None:
+        try:
+            config_path.unlink()
+        except FileNotFoundError:
+            console.print("  ℹ️  No .localduckrc found.")
+        else:
+            console.print(f"  ✅ Removed config: [bold]{config_path}[/bold]")
+            removed_anything = True
     else:
         console.print("  ℹ️  No .localduckrc found.")
 
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, PrivateAttr
 
 from localduck.types import (
     AgentMode,
@@ -18,6 +19,19 @@ from localduck.types import (
 
 CONFIG_FILENAME = ".localduckrc"
 
+# ChecksConfig field name → check category
+_CATEGORY_BY_FIELD: dict[str, CheckCategory] = {
+    "code_quality": CheckCategory.CODE_QUALITY,
+    "security": CheckCategory.SECURITY,
+    "code_smell": CheckCategory.CODE_SMELL,
+    "license": CheckCategory.LICENSE,
+    "documentation": CheckCategory.DOCUMENTATION,
+    "test_coverage": CheckCategory.TEST_COVERAGE,
+    "performance": CheckCategory.PERFORMANCE,
+    "accessibility": CheckCategory.ACCESSIBILITY,
+    "llm_specific": CheckCategory.LLM_SPECIFIC,
+}
+
 
 class ChecksConfig(BaseModel):
     """Toggle individual check categories."""
@@ -34,20 +48,16 @@ class ChecksConfig(BaseModel):
 
     model_config = {"populate_by_name": True}
 
-    def enabled_categories(self) -> list[CheckCategory]:
-        """Return the list of enabled check categories."""
-        mapping: dict[str, CheckCategory] = {
-            "code_quality": CheckCategory.CODE_QUALITY,
-            "security": CheckCategory.SECURITY,
-            "code_smell": CheckCategory.CODE_SMELL,
-            "license": CheckCategory.LICENSE,
-            "documentation": CheckCategory.DOCUMENTATION,
-            "test_coverage": CheckCategory.TEST_COVERAGE,
-            "performance": CheckCategory.PERFORMANCE,
-            "accessibility": CheckCategory.ACCESSIBILITY,
-            "llm_specific": CheckCategory.LLM_SPECIFIC,
-        }
-        return [cat for attr, cat in mapping.items() if getattr(self, attr)]
+    _enabled: tuple[CheckCategory, ...] = PrivateAttr(default=())
+
+    def model_post_init(self, __context: Any) -> None:
+        self._enabled = tuple(
+            cat for attr, cat in _CATEGORY_BY_FIELD.items() if getattr(self, attr)
+        )
+
+    def enabled_categories(self) -> tuple[CheckCategory, ...]:
+        """Return the enabled check categories, precomputed at validation."""
+        return self._enabled
 
 
 class LocalDuckConfig(BaseModel):
@@ -59,6 +69,7 @@ class LocalDuckConfig(BaseModel):
     api_key: str | None = Field(None, alias="apiKey")
     block_on: BlockOn = Field("critical", alias="blockOn")
     token_budget: int = Field(50_000, alias="tokenBudget")
+    skip_threshold_bytes: int = Field(32, alias="skipThresholdBytes")
     cache_threshold: float = Field(0.92, alias="cacheThreshold")
     max_concurrent: int = Field(3, alias="maxConcurrent")
     checks: ChecksConfig = Field(default_factory=ChecksConfig)
@@ -69,25 +80,16 @@ class LocalDuckConfig(BaseModel):
 
     def to_rc_dict(self) -> dict[str, Any]:
         """Serialize to the JSON structure used in .localduckrc."""
-        data: dict[str, Any] = {"agent": self.agent}
-        if self.provider is not None:
-            data["provider"] = self.provider
-        if self.model is not None:
-            data["model"] = self.model
-        if self.api_key is not None:
-            data["apiKey"] = self.api_key
-        data["blockOn"] = self.block_on
-        data["tokenBudget"] = self.token_budget
-        data["cacheThreshold"] = self.cache_threshold
-        data["maxConcurrent"] = self.max_concurrent
-        data["checks"] = self.checks.model_dump(by_alias=True)
-        data["reportFormat"] = self.report_format
-        data["reportDir"] = self.report_dir
-        return data
+        # Unset optional fields (provider/model/apiKey) are omitted entirely
+        return self.model_dump(by_alias=True, exclude_none=True)
 
 
+@lru_cache(maxsize=1)
 def find_config_file(start: Path | None = None) -> Path | None:
-    """Walk up from `start` (default: cwd) to find .localduckrc."""
+    """Walk up from `start` (default: cwd) to find .localduckrc.
+
+    Cached for the process lifetime; save_config invalidates it.
+    """
     current = (start or Path.cwd()).resolve()
     for directory in [current, *current.parents]:
         candidate = directory / CONFIG_FILENAME
@@ -96,21 +98,39 @@ def find_config_file(start: Path | None = None) -> Path | None:
     return None
 
 
+# Parsed config memoized across subcommands within one process
+_cached_config: LocalDuckConfig | None = None
+
+
 def load_config(path: Path | None = None) -> LocalDuckConfig:
     """Load and validate config from .localduckrc, falling back to defaults."""
+    global _cached_config
+    if path is None and _cached_config is not None:
+        return _cached_config
+
     config_path = path or find_config_file()
     if config_path is None or not config_path.is_file():
-        return LocalDuckConfig()
+        config = LocalDuckConfig()
+    else:
+        raw = orjson.loads(config_path.read_bytes())
+        config = LocalDuckConfig.model_validate(raw)
 
-    raw = json.loads(config_path.read_text(encoding="utf-8"))
-    return LocalDuckConfig.model_validate(raw)
+    if path is None:
+        _cached_config = config
+    return config
 
 
 def save_config(config: LocalDuckConfig, directory: Path | None = None) -> Path:
     """Write config to .localduckrc in the given directory (default: cwd)."""
+    global _cached_config
     target = (directory or Path.cwd()) / CONFIG_FILENAME
-    target.write_text(
-        json.dumps(config.to_rc_dict(), indent=2) + "\n",
-        encoding="utf-8",
+    target.write_bytes(
+        orjson.dumps(
+            config.to_rc_dict(),
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+        )
     )
+    # Invalidate the memoized lookups so the next load sees this file
+    _cached_config = None
+    find_config_file.cache_clear()
     return target
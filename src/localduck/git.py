@@ -8,70 +8,81 @@ from pathlib import Path
 
 from localduck.types import FileDiff
 
-# Regex to split a unified diff into per-file chunks
-_DIFF_HEADER_RE = re.compile(r"^diff --git a/(.+?) b/(.+?)$", re.MULTILINE)
-_NEW_FILE_RE = re.compile(r"^new file mode", re.MULTILINE)
-_DELETED_FILE_RE = re.compile(r"^deleted file mode", re.MULTILINE)
-
-
-def _run_git(*args: str, cwd: Path | None = None) -> str:
-    """Execute a git command and return stdout."""
+# Regex to split a unified diff into per-file chunks — header and body are
+# captured in one pass so the diff text is walked exactly once. Operates on
+# bytes so multi-MB diffs are never decoded wholesale.
+_DIFF_RE = re.compile(
+    rb"^diff --git a/(?P<a>.+?) b/(?P<b>.+?)$\n?"
+    rb"(?P<body>.*?)(?=^diff --git |\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+
+# Line-anchored so content lines that merely mention the phrases mid-line
+# can't be mistaken for the extended header
+_NEW_FILE_RE = re.compile(rb"^new file mode", re.MULTILINE)
+_DELETED_FILE_RE = re.compile(rb"^deleted file mode", re.MULTILINE)
+
+
+def _run_git(*args: str, cwd: Path | None = None) -> bytes:
+    """Execute a git command and return raw stdout bytes."""
     result = subprocess.run(
         ["git", *args],
         capture_output=True,
-        text=True,
         cwd=cwd,
         check=False,
     )
     if result.returncode != 0:
-        msg = result.stderr.strip() or f"git {' '.join(args)} failed"
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
+        msg = stderr or f"git {' '.join(args)} failed"
         raise RuntimeError(msg)
     return result.stdout
 
 
 def get_repo_root(cwd: Path | None = None) -> Path:
     """Return the root directory of the current git repository."""
-    root = _run_git("rev-parse", "--show-toplevel", cwd=cwd).strip()
-    return Path(root)
+    root = _run_git("rev-parse", "--show-toplevel", cwd=cwd)
+    return Path(root.decode("utf-8", errors="replace").strip())
 
 
-def get_staged_diff(cwd: Path | None = None) -> str:
-    """Return the full unified diff of staged changes."""
+def get_staged_diff(cwd: Path | None = None) -> bytes:
+    """Return the full unified diff of staged changes as raw bytes."""
     return _run_git("diff", "--staged", "--unified=3", cwd=cwd)
 
 
-def get_all_diff(cwd: Path | None = None) -> str:
-    """Return the diff of all tracked files against HEAD."""
+def get_all_diff(cwd: Path | None = None) -> bytes:
+    """Return the diff of all tracked files against HEAD as raw bytes."""
     return _run_git("diff", "HEAD", "--unified=3", cwd=cwd)
 
 
-def parse_diff_by_file(raw_diff: str) -> list[FileDiff]:
-    """Split a unified diff string into per-file FileDiff objects."""
-    if not raw_diff.strip():
-        return []
+def parse_diff_by_file(raw_diff: bytes) -> list[FileDiff]:
+    """Split a raw unified diff into per-file FileDiff objects.
 
-    # Find all diff headers and their positions
-    matches = list(_DIFF_HEADER_RE.finditer(raw_diff))
-    if not matches:
+    The diff is scanned as bytes; each chunk is decoded exactly once when
+    its FileDiff is constructed.
+    """
+    if not raw_diff.strip():
         return []
 
     diffs: list[FileDiff] = []
 
-    for i, match in enumerate(matches):
-        start = match.start()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(raw_diff)
-        chunk = raw_diff[start:end]
+    for match in _DIFF_RE.finditer(raw_diff):
+        # File-mode lines sit in the first lines after the header, so only a
+        # small body prefix needs inspecting — not the whole chunk
+        body_start, body_end = match.span("body")
+        head = raw_diff[body_start : min(body_end, body_start + 200)]
 
-        file_path = match.group(2)
-        is_new = bool(_NEW_FILE_RE.search(chunk))
-        is_deleted = bool(_DELETED_FILE_RE.search(chunk))
+        # Trim whitespace by adjusting the span bounds, so each chunk is
+        # copied out of the diff exactly once (group(0).strip() copies twice)
+        start, end = match.span()
+        while end > start and raw_diff[end - 1] in b" \t\r\n":
+            end -= 1
 
         diffs.append(
             FileDiff(
-                path=file_path,
-                diff=chunk.strip(),
-                is_new=is_new,
-                is_deleted=is_deleted,
+                path=match.group("b").decode("utf-8", errors="replace"),
+                diff=raw_diff[start:end].decode("utf-8", errors="replace"),
+                is_new=_NEW_FILE_RE.search(head) is not None,
+                is_deleted=_DELETED_FILE_RE.search(head) is not None,
             )
         )
 
@@ -79,11 +90,9 @@ def parse_diff_by_file(raw_diff: str) -> list[FileDiff]:
 
 
 def has_staged_changes(cwd: Path | None = None) -> bool:
-    """Check if there are any staged changes."""
-    result = subprocess.run(
-        ["git", "diff", "--staged", "--quiet"],
-        capture_output=True,
-        cwd=cwd,
-        check=False,
-    )
-    return result.returncode != 0
+    """Check if there are any staged changes.
+
+    Uses a name-only diff so no file content is materialized for the common
+    fast-path commit with nothing staged.
+    """
+    return bool(_run_git("diff", "--staged", "--name-only", cwd=cwd).strip())
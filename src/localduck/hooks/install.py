@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import stat
 from pathlib import Path
 
@@ -49,9 +50,11 @@ def install_hook(repo_root: Path | None = None) -> Path:
             backup = hook_path.with_suffix(".pre-localduck")
             hook_path.rename(backup)
 
-    hook_path.write_text(_HOOK_CONTENT, encoding="utf-8")
-
-    # Make executable
-    hook_path.chmod(hook_path.stat().st_mode | stat.S_IEXEC)
+    # Write to a sibling temp file and os.replace it in, so a crash mid-write
+    # never leaves a truncated (and executable) hook behind
+    tmp_path = hook_path.with_suffix(".tmp")
+    tmp_path.write_bytes(_HOOK_CONTENT.encode("utf-8"))
+    tmp_path.chmod(tmp_path.stat().st_mode | stat.S_IEXEC)
+    os.replace(tmp_path, hook_path)
 
     return hook_path
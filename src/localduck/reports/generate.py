@@ -6,17 +6,41 @@ from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 
-from jinja2 import Environment, PackageLoader
+from jinja2 import Environment, FileSystemBytecodeCache, PackageLoader
 
 from localduck.types import Issue, ReportFormat, ScanResult, Severity
 
+_BYTECODE_CACHE_DIR = Path.home() / ".localduck" / "cache" / "jinja_bytecode"
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    """Persist compiled templates on disk.
+
+    The pre-commit hook spawns a fresh interpreter per commit, so skipping
+    the template compile step across processes is the dominant win.
+    """
+    try:
+        _BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(str(_BYTECODE_CACHE_DIR))
+
+
 _env = Environment(
     loader=PackageLoader("localduck.reports", "templates"),
     autoescape=True,
     trim_blocks=True,
     lstrip_blocks=True,
+    auto_reload=False,
+    bytecode_cache=_bytecode_cache(),
 )
 
+# Resolved once at import — generate_report does a plain dict lookup
+_TEMPLATES = {
+    "html": _env.get_template("report.html.j2"),
+    "markdown": _env.get_template("report.md.j2"),
+}
+
 
 def _group_issues_by_file(issues: list[Issue]) -> dict[str, list[Issue]]:
     """Group issues by file path, preserving insertion order."""
@@ -54,31 +78,30 @@ def generate_report(
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
     date_slug = datetime.now(timezone.utc).strftime("%Y-%m-%d_%H%M")
 
-    template_name = "report.html.j2" if fmt == "html" else "report.md.j2"
     extension = ".html" if fmt == "html" else ".md"
 
-    template = _env.get_template(template_name)
-    content = template.render(
+    report_path = output_dir / f"report-{date_slug}{extension}"
+
+    # Stream template chunks straight to disk instead of materializing the
+    # whole report string — keeps peak memory flat for issue-heavy scans
+    _TEMPLATES[fmt].stream(
         result=result,
         issues_by_file=_group_issues_by_file(result.issues),
         counts=_severity_counts(result.issues),
         timestamp=timestamp,
-    )
-
-    report_path = output_dir / f"report-{date_slug}{extension}"
-    report_path.write_text(content, encoding="utf-8")
+    ).dump(str(report_path), encoding="utf-8")
 
     return report_path
 
 
 def get_latest_report(report_dir: Path) -> Path | None:
-    """Find the most recent report file in the given directory."""
+    """Find the most recent report file in the given directory.
+
+    The filename date slug is ISO-ordered, so the lexicographically largest
+    name is the newest — no stat() call per file, and immune to mtime
+    changes from backup tools.
+    """
     if not report_dir.is_dir():
         return None
 
-    reports = sorted(
-        report_dir.glob("report-*"),
-        key=lambda p: p.stat().st_mtime,
-        reverse=True,
-    )
-    return reports[0] if reports else None
+    return max(report_dir.glob("report-*"), key=lambda p: p.name, default=None)
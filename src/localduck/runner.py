@@ -46,7 +46,10 @@ async def run_scan(
     logger.info("adapter_ready", adapter=adapter.label)
 
     # Run the full pipeline
-    result = await run_pipeline(diffs, adapter, cfg)
+    try:
+        result = await run_pipeline(diffs, adapter, cfg)
+    finally:
+        await adapter.aclose()
 
     # Generate report
     report_dir = Path(cfg.report_dir)
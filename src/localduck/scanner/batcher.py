@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+
 from localduck.types import FileDiff
 
 # Approximate chars-per-token ratio (conservative for most models)
@@ -32,16 +34,22 @@ _HIGH_RISK_SEGMENTS = frozenset({
     "tls",
 })
 
+# One compiled alternation (longest segment first) so each path is scanned in
+# a single pass instead of once per segment
+_RISK_RE = re.compile(
+    "|".join(sorted(map(re.escape, _HIGH_RISK_SEGMENTS), key=len, reverse=True))
+)
+
+
+def _risk_score(path_lower: str, is_new: bool) -> int:
+    """Higher score = higher priority for review. Security-sensitive files first.
 
-def _risk_score(fd: FileDiff) -> int:
-    """Higher score = higher priority for review. Security-sensitive files first."""
-    path_lower = fd.path.lower()
-    score = 0
-    for segment in _HIGH_RISK_SEGMENTS:
-        if segment in path_lower:
-            score += 10
+    Takes the pre-lowered path so callers that already lowered it for other
+    checks don't pay for a second copy.
+    """
+    score = 10 * len(_RISK_RE.findall(path_lower))
     # New files are higher risk than modifications
-    if fd.is_new:
+    if is_new:
         score += 5
     return score
 
@@ -51,11 +59,6 @@ def estimate_tokens(text: str) -> int:
     return len(text) // CHARS_PER_TOKEN
 
 
-def prioritize_diffs(diffs: list[FileDiff]) -> list[FileDiff]:
-    """Sort diffs by risk score (descending) so security-sensitive files are reviewed first."""
-    return sorted(diffs, key=_risk_score, reverse=True)
-
-
 def batch_diffs(
     diffs: list[FileDiff],
     max_tokens_per_batch: int = 12_000,
@@ -78,7 +81,7 @@ def batch_diffs(
     total_tokens = 0
 
     for fd in diffs:
-        diff_tokens = estimate_tokens(fd.diff)
+        diff_tokens = fd.token_est
 
         # Check total budget
         if token_budget is not None and total_tokens + diff_tokens > token_budget:
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 import time
 from pathlib import Path
 
 import chromadb
 import numpy as np
+import orjson
 import structlog
 
 from localduck.types import Issue, Severity, CheckCategory
@@ -70,6 +70,42 @@ class ReviewCache:
         issues_json = metadata.get("issues", "[]")  # type: ignore[union-attr]
         return _deserialize_issues(str(issues_json))
 
+    def query_many(
+        self,
+        embeddings: list[np.ndarray],
+        threshold: float = 0.92,
+    ) -> list[list[Issue] | None]:
+        """Look up several embeddings in one batched query.
+
+        Returns a list aligned with `embeddings`: the cached issues for
+        entries matching above `threshold`, None elsewhere.
+        """
+        if not embeddings:
+            return []
+        if self._collection.count() == 0:
+            return [None] * len(embeddings)
+
+        results = self._collection.query(
+            query_embeddings=[embedding.tolist() for embedding in embeddings],
+            n_results=1,
+            include=["distances", "metadatas"],
+        )
+
+        distances = results["distances"] or []
+        metadatas = results["metadatas"] or []
+        hits: list[list[Issue] | None] = []
+        for i in range(len(embeddings)):
+            if i >= len(distances) or not distances[i]:
+                hits.append(None)
+                continue
+            similarity = 1.0 - distances[i][0]
+            if similarity < threshold:
+                hits.append(None)
+                continue
+            metadata = metadatas[i][0]  # type: ignore[index]
+            hits.append(_deserialize_issues(str(metadata.get("issues", "[]"))))  # type: ignore[union-attr]
+        return hits
+
     def store(self, embedding: np.ndarray, issues: list[Issue], file_path: str) -> None:
         """Store a review result in the cache."""
         doc_id = f"{file_path}_{int(time.time() * 1000)}"
@@ -84,14 +120,53 @@ class ReviewCache:
             documents=[file_path],
         )
 
+    def store_many(
+        self,
+        embeddings: list[np.ndarray],
+        issues_per_file: list[list[Issue]],
+        file_paths: list[str],
+    ) -> None:
+        """Store several review results in one batched write.
+
+        A single `.add` call means one SQLite write lock / HNSW insert round
+        trip instead of one per file.
+        """
+        if not file_paths:
+            return
+        now_ms = int(time.time() * 1000)
+        now = int(time.time())
+        self._collection.add(
+            ids=[f"{path}_{now_ms}" for path in file_paths],
+            embeddings=[embedding.tolist() for embedding in embeddings],
+            metadatas=[
+                {
+                    "file_path": path,
+                    "issues": _serialize_issues(issues),
+                    "timestamp": now,
+                }
+                for path, issues in zip(file_paths, issues_per_file, strict=True)
+            ],
+            documents=list(file_paths),
+        )
+
     def clear(self) -> int:
         """Clear all cached entries. Returns the number of entries deleted."""
         count = self._collection.count()
-        self._client.delete_collection(_COLLECTION_NAME)
-        self._collection = self._client.get_or_create_collection(
-            name=_COLLECTION_NAME,
-            metadata={"hnsw:space": "cosine"},
-        )
+        if count == 0:
+            return 0
+        try:
+            # Delete entries in place — keeps the HNSW index allocated rather
+            # than tearing down and rebuilding the whole collection
+            ids = self._collection.get(include=[])["ids"]
+            if ids:
+                self._collection.delete(ids=ids)
+        except Exception as exc:  # get/delete signatures vary across Chroma versions
+            logger.warning("cache_clear_fallback", error=str(exc))
+            self._client.delete_collection(_COLLECTION_NAME)
+            self._collection = self._client.get_or_create_collection(
+                name=_COLLECTION_NAME,
+                metadata={"hnsw:space": "cosine"},
+            )
         return count
 
     def stats(self) -> dict[str, int | float]:
@@ -104,7 +179,7 @@ class ReviewCache:
 
 def _serialize_issues(issues: list[Issue]) -> str:
     """Serialize issues to JSON string for ChromaDB metadata storage."""
-    return json.dumps([
+    return orjson.dumps([
         {
             "file": i.file,
             "line": i.line,
@@ -114,14 +189,14 @@ def _serialize_issues(issues: list[Issue]) -> str:
             "suggestion": i.suggestion,
         }
         for i in issues
-    ])
+    ]).decode()
 
 
 def _deserialize_issues(raw: str) -> list[Issue]:
     """Deserialize issues from JSON string."""
     try:
-        data = json.loads(raw)
-    except json.JSONDecodeError:
+        data = orjson.loads(raw)
+    except orjson.JSONDecodeError:
         return []
 
     issues: list[Issue] = []
@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 import numpy as np
 import structlog
 
-from localduck.scanner.embedder import cosine_similarity, embed_texts
+from localduck.scanner.embedder import embed_texts
 from localduck.types import FileDiff
 
 logger = structlog.get_logger()
@@ -21,59 +21,117 @@ class DedupResult:
     unique: list[FileDiff] = field(default_factory=list)
     # Map: representative FileDiff path → list of duplicate FileDiff paths
     groups: dict[str, list[str]] = field(default_factory=dict)
-    # Embeddings for the unique diffs, in same order as `unique`
-    embeddings: list[np.ndarray] = field(default_factory=list)
+    # Embedding matrix of shape (len(unique), dim) — row i matches unique[i].
+    # One contiguous array instead of a list of rows halves the memory
+    # overhead and feeds Chroma's batched APIs directly.
+    embeddings: np.ndarray = field(
+        default_factory=lambda: np.empty((0, 0), dtype=np.float32)
+    )
+
+
+def _greedy_groups_loop(similarity: np.ndarray, threshold: float) -> np.ndarray:
+    """Plain-loop greedy assignment — the numba-compilable kernel.
+
+    Returns rep, where rep[i] is the index of diff i's representative and
+    rep[i] == i marks a unique diff.
+    """
+    n = similarity.shape[0]
+    rep = np.full(n, -1, dtype=np.int64)
+    for i in range(n):
+        if rep[i] >= 0:
+            continue
+        rep[i] = i
+        for j in range(i + 1, n):
+            if rep[j] < 0 and similarity[i, j] >= threshold:
+                rep[j] = i
+    return rep
+
+
+# Resolved on first use: the numba import itself is slow, so it must not
+# tax startup, and numba stays an optional accelerator rather than a dep
+_jit_kernel: object | None = None
+_jit_checked = False
+
+
+def _greedy_groups(similarity: np.ndarray, threshold: float) -> np.ndarray:
+    """Greedy duplicate assignment over the cosine similarity matrix.
+
+    Uses the numba-compiled kernel when numba is installed — the loop is
+    pure numerics over a float matrix, an ideal JIT target — and falls back
+    to a vectorized row-mask sweep otherwise.
+    """
+    global _jit_kernel, _jit_checked
+    if not _jit_checked:
+        _jit_checked = True
+        try:
+            from numba import njit
+
+            _jit_kernel = njit(cache=True)(_greedy_groups_loop)
+        except ImportError:
+            _jit_kernel = None
+
+    if _jit_kernel is not None:
+        return _jit_kernel(similarity, threshold)
+
+    n = similarity.shape[0]
+    rep = np.full(n, -1, dtype=np.int64)
+    assigned = np.zeros(n, dtype=bool)
+    for i in range(n):
+        if assigned[i]:
+            continue
+        assigned[i] = True
+        rep[i] = i
+        dupes = np.nonzero((similarity[i] >= threshold) & ~assigned)[0]
+        if dupes.size:
+            assigned[dupes] = True
+            rep[dupes] = i
+    return rep
 
 
 def deduplicate(
     diffs: list[FileDiff],
     threshold: float = 0.95,
+    embeddings: np.ndarray | None = None,
 ) -> DedupResult:
     """Find near-duplicate diffs within a batch.
 
     Diffs with cosine similarity above `threshold` are grouped together.
     Only the first member of each group is marked as unique (needs review).
+    Callers that already embedded the diffs (row i matching diffs[i]) can
+    pass `embeddings` to skip the encoder call.
     """
     if not diffs:
         return DedupResult()
 
+    if embeddings is None:
+        # Embed all diffs in one batch call
+        embeddings = embed_texts([fd.diff for fd in diffs])
+
     if len(diffs) == 1:
-        embeddings = embed_texts([diffs[0].diff])
         return DedupResult(
             unique=list(diffs),
             groups={},
-            embeddings=[embeddings[0]],
+            embeddings=np.asarray(embeddings, dtype=np.float32),
         )
 
-    # Embed all diffs in one batch call
-    texts = [fd.diff for fd in diffs]
-    all_embeddings = embed_texts(texts)
+    # One BLAS matmul for the full n-by-n cosine matrix instead of O(n²)
+    # Python-level dot products; embed_texts returns unit vectors, so no
+    # re-normalization is needed
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    similarity = matrix @ matrix.T
 
-    assigned: set[int] = set()
-    unique: list[FileDiff] = []
-    unique_embeddings: list[np.ndarray] = []
-    groups: dict[str, list[str]] = {}
+    rep = _greedy_groups(similarity, float(threshold))
 
-    for i in range(len(diffs)):
-        if i in assigned:
-            continue
+    indices = np.arange(len(diffs))
+    unique_indices = np.nonzero(rep == indices)[0]
+    unique = [diffs[int(i)] for i in unique_indices]
+
+    groups: dict[str, list[str]] = {}
+    for j in np.nonzero(rep != indices)[0]:
+        groups.setdefault(diffs[int(rep[j])].path, []).append(diffs[int(j)].path)
 
-        assigned.add(i)
-        unique.append(diffs[i])
-        unique_embeddings.append(all_embeddings[i])
-        duplicates: list[str] = []
-
-        # Check remaining diffs against this representative
-        for j in range(i + 1, len(diffs)):
-            if j in assigned:
-                continue
-            sim = cosine_similarity(all_embeddings[i], all_embeddings[j])
-            if sim >= threshold:
-                assigned.add(j)
-                duplicates.append(diffs[j].path)
-
-        if duplicates:
-            groups[diffs[i].path] = duplicates
+    # One fancy-index copy pulls the unique rows into a contiguous matrix
+    unique_embeddings = matrix[unique_indices]
 
     logger.debug(
         "dedup_complete",
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-import numpy as np
+from typing import TYPE_CHECKING
+
 import structlog
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = structlog.get_logger()
 
 # Lazy-loaded model singleton
@@ -24,24 +28,34 @@ def _get_model():  # type: ignore[no-untyped-def]
 
 
 def embed_text(text: str) -> np.ndarray:
-    """Embed a single text string into a vector."""
+    """Embed a single text string into a unit-norm vector."""
     model = _get_model()
-    vector: np.ndarray = model.encode(text, convert_to_numpy=True, show_progress_bar=False)
+    vector: np.ndarray = model.encode(
+        text,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
     return vector
 
 
 def embed_texts(texts: list[str]) -> np.ndarray:
-    """Embed multiple texts into a matrix of vectors."""
+    """Embed multiple texts into a matrix of unit-norm vectors."""
     model = _get_model()
-    vectors: np.ndarray = model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
+    vectors: np.ndarray = model.encode(
+        texts,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        batch_size=64,
+        show_progress_bar=False,
+    )
     return vectors
 
 
 def cosine_similarity(a: np.ndarray, b: np.ndarray) -> float:
-    """Compute cosine similarity between two vectors."""
-    dot = float(np.dot(a, b))
-    norm_a = float(np.linalg.norm(a))
-    norm_b = float(np.linalg.norm(b))
-    if norm_a == 0 or norm_b == 0:
-        return 0.0
-    return dot / (norm_a * norm_b)
+    """Cosine similarity between two embeddings.
+
+    Embeddings from this module are unit vectors (normalization is fused
+    into the model's forward pass), so this is a plain dot product.
+    """
+    return float(a @ b)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 
+from localduck.scanner.batcher import _risk_score
 from localduck.types import FileDiff
 
 # File extensions that should never be reviewed
@@ -39,53 +40,58 @@ _SKIP_EXTENSIONS = frozenset({
     ".br",
 })
 
-# Filename patterns that should never be reviewed
-_SKIP_PATTERNS = re.compile(
-    r"(^|/)("
-    r"package-lock\.json"
-    r"|yarn\.lock"
-    r"|pnpm-lock\.yaml"
-    r"|Pipfile\.lock"
-    r"|poetry\.lock"
-    r"|uv\.lock"
-    r"|Cargo\.lock"
-    r"|Gemfile\.lock"
-    r"|composer\.lock"
-    r"|\.DS_Store"
-    r"|Thumbs\.db"
-    r")$"
+# Exact filenames that should never be reviewed
+_SKIP_FILENAMES = frozenset({
+    "package-lock.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    "Pipfile.lock",
+    "poetry.lock",
+    "uv.lock",
+    "Cargo.lock",
+    "Gemfile.lock",
+    "composer.lock",
+    ".DS_Store",
+    "Thumbs.db",
+})
+
+# Both skip lists fused into one compiled alternation — a single C-level
+# regex walk per path instead of ~30 Python-level endswith calls. Longest
+# alternatives first so overlapping suffixes (.min.js vs .js) never force
+# backtracking.
+_SKIP_RE = re.compile(
+    "(?:{exts})$|(?:^|/)(?:{names})$".format(
+        exts="|".join(sorted(map(re.escape, _SKIP_EXTENSIONS), key=len, reverse=True)),
+        names="|".join(sorted(map(re.escape, _SKIP_FILENAMES), key=len, reverse=True)),
+    ),
+    re.IGNORECASE,
 )
 
 
 def _should_skip(path: str) -> bool:
     """Return True if the file should be skipped based on path/extension."""
-    lower = path.lower()
-
-    # Check extensions
-    for ext in _SKIP_EXTENSIONS:
-        if lower.endswith(ext):
-            return True
-
-    # Check filename patterns
-    if _SKIP_PATTERNS.search(path):
-        return True
+    return _SKIP_RE.search(path) is not None
 
-    return False
 
+def filter_and_prioritize(diffs: list[FileDiff]) -> tuple[list[FileDiff], list[str]]:
+    """Separate reviewable diffs from skipped files, ordered by risk.
 
-def filter_diffs(diffs: list[FileDiff]) -> tuple[list[FileDiff], list[str]]:
-    """Separate reviewable diffs from skipped files.
+    A single pass runs the skip check and computes the risk score for each
+    path; the reviewable list is then sorted once by the precomputed scores,
+    so security-sensitive files come first.
 
     Returns:
-        (reviewable, skipped_paths) tuple.
+        (reviewable_by_risk_desc, skipped_paths) tuple.
     """
-    reviewable: list[FileDiff] = []
+    scored: list[tuple[int, FileDiff]] = []
     skipped: list[str] = []
 
     for fd in diffs:
         if _should_skip(fd.path):
             skipped.append(fd.path)
         else:
-            reviewable.append(fd)
+            scored.append((_risk_score(fd.path.lower(), fd.is_new), fd))
 
-    return reviewable, skipped
+    # Stable sort on the precomputed score keeps diff order within a tier
+    scored.sort(key=lambda pair: pair[0], reverse=True)
+    return [fd for _, fd in scored], skipped
@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
+from dataclasses import replace
 from typing import TYPE_CHECKING
 
 import structlog
 
-from localduck.scanner.batcher import batch_diffs, prioritize_diffs
 from localduck.scanner.cache import ReviewCache
 from localduck.scanner.dedup import deduplicate
-from localduck.scanner.embedder import embed_text
-from localduck.scanner.filter import filter_diffs
+from localduck.scanner.embedder import embed_texts
+from localduck.scanner.filter import filter_and_prioritize
 from localduck.types import FileDiff, Issue, ScanResult
 
 if TYPE_CHECKING:
@@ -29,19 +30,18 @@ async def run_pipeline(
     """Execute the full scan pipeline on a set of file diffs.
 
     Steps:
-    1. Filter out non-reviewable files
-    2. Prioritize by risk surface
-    3. Deduplicate near-identical diffs
-    4. Check embedding cache for already-reviewed diffs
-    5. Batch remaining diffs within context window limits
-    6. Send batches to LLM concurrently (with concurrency limit)
-    7. Store results in cache
-    8. Merge and return all issues
+    1. Filter out non-reviewable files and prioritize by risk surface
+    2. Embed diffs (overlapping cache startup) and deduplicate
+    3. Check embedding cache for already-reviewed diffs
+    4. Batch remaining diffs within context window limits
+    5. Send batches to LLM concurrently (with concurrency limit)
+    6. Store results in cache
+    7. Merge and return all issues
     """
     result = ScanResult()
 
-    # Step 1: Filter
-    reviewable, skipped_paths = filter_diffs(diffs)
+    # Step 1: Filter and prioritize in one pass
+    reviewable, skipped_paths = filter_and_prioritize(diffs)
     result.files_skipped = len(skipped_paths)
     result.skipped_files = skipped_paths
     logger.info("filter_complete", reviewable=len(reviewable), skipped=len(skipped_paths))
@@ -49,11 +49,19 @@ async def run_pipeline(
     if not reviewable:
         return result
 
-    # Step 2: Prioritize
-    reviewable = prioritize_diffs(reviewable)
+    # Step 2: Embed in a worker thread — the encoder's forward pass releases
+    # the GIL, so it overlaps with the Chroma client startup below
+    embed_fut = asyncio.get_running_loop().run_in_executor(
+        None, embed_texts, [fd.diff for fd in reviewable]
+    )
+    cache = ReviewCache()
 
-    # Step 3: Deduplicate
-    dedup_result = deduplicate(reviewable, threshold=config.cache_threshold)
+    # Deduplicate on the precomputed embeddings once they land
+    dedup_result = deduplicate(
+        reviewable,
+        threshold=config.cache_threshold,
+        embeddings=await embed_fut,
+    )
     result.files_deduped = sum(len(dupes) for dupes in dedup_result.groups.values())
     logger.info(
         "dedup_complete",
@@ -61,22 +69,29 @@ async def run_pipeline(
         deduped=result.files_deduped,
     )
 
-    # Step 4: Cache check
-    cache = ReviewCache()
+    # Step 3: Cache check — one batched query; skipped entirely when the
+    # threshold disables caching or the cache has no entries
     needs_review: list[FileDiff] = []
     needs_review_embeddings: list[object] = []
     cached_issues: list[Issue] = []
 
-    for fd, embedding in zip(dedup_result.unique, dedup_result.embeddings):
-        cached = cache.query(embedding, threshold=config.cache_threshold)
-        if cached is not None:
-            cached_issues.extend(cached)
-            result.cache_hits += 1
-            result.files_cached += 1
-            logger.debug("cache_hit", file=fd.path)
-        else:
-            needs_review.append(fd)
-            needs_review_embeddings.append(embedding)
+    if config.cache_threshold >= 1.0 or cache.count == 0:
+        needs_review = list(dedup_result.unique)
+        needs_review_embeddings = list(dedup_result.embeddings)
+    else:
+        hits = cache.query_many(
+            list(dedup_result.embeddings),
+            threshold=config.cache_threshold,
+        )
+        for fd, embedding, cached in zip(dedup_result.unique, dedup_result.embeddings, hits):
+            if cached is not None:
+                cached_issues.extend(cached)
+                result.cache_hits += 1
+                result.files_cached += 1
+                logger.debug("cache_hit", file=fd.path)
+            else:
+                needs_review.append(fd)
+                needs_review_embeddings.append(embedding)
 
     logger.info(
         "cache_check_complete",
@@ -84,9 +99,9 @@ async def run_pipeline(
         misses=len(needs_review),
     )
 
-    # Step 5: Batch
+    # Steps 4+5: Batch within context limits and review concurrently
     token_budget = config.token_budget if config.token_budget > 0 else None
-    batches, budget_skipped = batch_diffs(
+    new_issues, budget_skipped = await adapter.review_many(
         needs_review,
         token_budget=token_budget,
     )
@@ -94,47 +109,31 @@ async def run_pipeline(
     result.files_scanned = len(reviewable) - len(budget_skipped)
 
     logger.info(
-        "batching_complete",
-        batches=len(batches),
+        "review_complete",
+        issues=len(new_issues),
         budget_skipped=len(budget_skipped),
     )
 
-    # Step 6: Review batches concurrently with semaphore
-    semaphore = asyncio.Semaphore(config.max_concurrent)
     all_issues: list[Issue] = list(cached_issues)
+    all_issues.extend(new_issues)
 
-    async def _review_batch(batch: list[FileDiff], batch_idx: int) -> list[Issue]:
-        async with semaphore:
-            logger.debug("reviewing_batch", batch=batch_idx, files=len(batch))
-            return await adapter.review(batch)
-
-    tasks = [_review_batch(batch, i) for i, batch in enumerate(batches)]
-    batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    for i, batch_result in enumerate(batch_results):
-        if isinstance(batch_result, Exception):
-            logger.error("batch_review_failed", batch=i, error=str(batch_result))
-            continue
-        all_issues.extend(batch_result)
-
-    # Step 7: Store results in cache
+    # Step 6: Store results in cache
     _store_in_background(cache, needs_review, needs_review_embeddings, all_issues)
 
-    # Step 8: Propagate issues to deduplicated files
-    for representative_path, duplicate_paths in dedup_result.groups.items():
-        rep_issues = [i for i in all_issues if i.file == representative_path]
-        for dup_path in duplicate_paths:
-            for issue in rep_issues:
-                all_issues.append(
-                    Issue(
-                        file=dup_path,
-                        line=issue.line,
-                        severity=issue.severity,
-                        category=issue.category,
-                        message=issue.message,
-                        suggestion=issue.suggestion,
-                    )
-                )
+    # Step 7: Propagate issues to deduplicated files — group once instead of
+    # rescanning all_issues per representative
+    if dedup_result.groups:
+        issues_by_file: dict[str, list[Issue]] = defaultdict(list)
+        for issue in all_issues:
+            issues_by_file[issue.file].append(issue)
+
+        for representative_path, duplicate_paths in dedup_result.groups.items():
+            rep_issues = issues_by_file.get(representative_path, [])
+            all_issues.extend(
+                replace(issue, file=dup_path)
+                for dup_path in duplicate_paths
+                for issue in rep_issues
+            )
 
     result.issues = all_issues
     return result
@@ -146,10 +145,26 @@ def _store_in_background(
     embeddings: list[object],
     all_issues: list[Issue],
 ) -> None:
-    """Store review results back into the embedding cache."""
+    """Store review results back into the embedding cache in one batch."""
     import numpy as np
 
+    if not diffs:
+        return
+
+    # Group issues by file once instead of rescanning all_issues per diff
+    by_file: dict[str, list[Issue]] = defaultdict(list)
+    for issue in all_issues:
+        by_file[issue.file].append(issue)
+
+    batch_embeddings: list[np.ndarray] = []
+    issues_per_file: list[list[Issue]] = []
+    paths: list[str] = []
     for fd, embedding in zip(diffs, embeddings):
-        file_issues = [i for i in all_issues if i.file == fd.path]
         if isinstance(embedding, np.ndarray):
-            cache.store(embedding, file_issues, fd.path)
+            batch_embeddings.append(embedding)
+            issues_per_file.append(by_file.get(fd.path, []))
+            paths.append(fd.path)
+
+    # Kept synchronous — a detached task could be cancelled when the event
+    # loop closes right after the scan, silently dropping the entries
+    cache.store_many(batch_embeddings, issues_per_file, paths)
@@ -53,6 +53,13 @@ class FileDiff:
     diff: str
     is_new: bool = False
     is_deleted: bool = False
+    # Token estimate (~4 chars/token) computed once at construction — the
+    # batcher reads it repeatedly in tight loops
+    token_est: int = field(init=False, repr=False, compare=False, default=0)
+
+    def __post_init__(self) -> None:
+        # object.__setattr__ bypasses the frozen guard for the derived field
+        object.__setattr__(self, "token_est", len(self.diff) >> 2)
 
 
 @dataclass(frozen=True, slots=True)